@@ -35,6 +35,7 @@ class Body(QtWidgets.QStackedWidget):
         self.activeIndex = None
         self.binder = Binder()
         self.views = dict()
+        self.view_types = dict()
 
         match app.config.dashboard:
             case "legacy":
@@ -51,9 +52,19 @@ class Body(QtWidgets.QStackedWidget):
         self.showDashboard()
 
     def addView(self, object_type, view_type, *args, **kwargs):
+        self.view_types[object_type] = (view_type, args, kwargs)
+
+    def getView(self, object_type):
+        view = self.views.get(object_type)
+        if view is not None:
+            return view
+        if object_type not in self.view_types:
+            return None
+        view_type, args, kwargs = self.view_types[object_type]
         view = view_type(parent=self, *args, **kwargs)
         self.views[object_type] = view
         self.addWidget(view)
+        return view
 
     def showItem(self, item: TreeItem, index: QtCore.QModelIndex):
         self.activeItem = item
@@ -62,7 +73,7 @@ class Body(QtWidgets.QStackedWidget):
             self.showDashboard()
             return False
         object = item.object
-        view = self.views.get(type(object))
+        view = self.getView(type(object))
         if not view:
             self.showDashboard()
             return False
@@ -91,7 +102,21 @@ class Body(QtWidgets.QStackedWidget):
             self.actions.open.setEnabled,
             lambda busy: not busy and task.can_open,
         )
-        self.binder.bind(task.properties.done, self.actions.save.setEnabled)
+        self.binder.bind(
+            task.properties.done,
+            self.actions.save.setEnabled,
+            lambda done: done and not task.busy_subtask,
+        )
+        self.binder.bind(
+            task.properties.busy_subtask,
+            self.actions.save.setEnabled,
+            lambda busy: not busy and task.done,
+        )
+        self.binder.bind(
+            task.properties.busy_subtask,
+            self.actions.clear.setEnabled,
+            lambda busy: not busy,
+        )
 
         self.binder.bind(self.actions.start.triggered, view.start)
         self.binder.bind(self.actions.stop.triggered, view.stop)
@@ -107,6 +132,7 @@ class Body(QtWidgets.QStackedWidget):
         self.binder.unbind_all()
         self.actions.stop.setVisible(False)
         self.actions.clear.setVisible(False)
+        self.actions.clear.setEnabled(True)
         self.actions.start.setVisible(True)
         self.actions.start.setEnabled(False)
         self.actions.save.setEnabled(False)
@@ -29,10 +29,10 @@ from itaxotools.taxi_gui import app
 from itaxotools.taxi_gui.model.common import ItemModel, Object
 from itaxotools.taxi_gui.model.input_file import InputFileModel
 from itaxotools.taxi_gui.model.tasks import SubtaskModel
-from itaxotools.taxi_gui.threading import ReportDone
+from itaxotools.taxi_gui.threading import ReportDone, ReportProgress
 from itaxotools.taxi_gui.types import FileFormat, FileInfo, Notification
 
-from .process import get_file_info
+from .process import get_file_info, save_results
 
 
 class ItemProxyModel(QtCore.QAbstractProxyModel):
@@ -42,12 +42,16 @@ class ItemProxyModel(QtCore.QAbstractProxyModel):
         super().__init__()
         self.unselected = "---"
         self.root = None
+        self._rows = {}
         if model and root:
             self.setSourceModel(model, root)
 
     def get_default_index(self):
         return self.index(0, 0)
 
+    def sourceRowsChanged(self, *args):
+        self._rows = {item: row for row, item in enumerate(self.root.children, 1)}
+
     def sourceDataChanged(self, topLeft, bottomRight):
         self.dataChanged.emit(
             self.mapFromSource(topLeft), self.mapFromSource(bottomRight)
@@ -62,14 +66,19 @@ class ItemProxyModel(QtCore.QAbstractProxyModel):
         super().setSourceModel(model)
         self.root = root
         self.source = model
+        self.sourceRowsChanged()
+        model.rowsInserted.connect(self.sourceRowsChanged)
+        model.rowsRemoved.connect(self.sourceRowsChanged)
+        model.modelReset.connect(self.sourceRowsChanged)
         model.dataChanged.connect(self.sourceDataChanged)
 
     @override
     def mapFromSource(self, sourceIndex):
         item = sourceIndex.internalPointer()
-        if not item or item.parent != self.root:
+        row = self._rows.get(item)
+        if row is None:
             return QtCore.QModelIndex()
-        return self.createIndex(item.row + 1, 0, item)
+        return self.createIndex(row, 0, item)
 
     @override
     def mapToSource(self, proxyIndex):
@@ -79,7 +88,7 @@ class ItemProxyModel(QtCore.QAbstractProxyModel):
             return QtCore.QModelIndex()
         item = proxyIndex.internalPointer()
         source = self.sourceModel()
-        return source.createIndex(item.row, 0, item)
+        return source.createIndex(self._rows[item] - 1, 0, item)
 
     @override
     def index(
@@ -137,6 +146,21 @@ class FileInfoSubtaskModel(SubtaskModel):
         self.busy = False
 
 
+class SaveSubtaskModel(SubtaskModel):
+    task_name = "SaveSubtask"
+
+    done = QtCore.Signal(Path)
+
+    def start(self, source: Path, destination: Path):
+        self.progression.emit(ReportProgress("Saving results..."))
+        self.busy = True
+        self.exec(save_results, source, destination)
+
+    def onDone(self, report: ReportDone):
+        self.done.emit(report.result)
+        self.busy = False
+
+
 class DataFileProtocol(Protocol):
     def is_valid(self) -> bool:
         pass
@@ -195,7 +219,7 @@ class ImportedInputModel(Object):
         self.binder.unbind_all()
         if object:
             for property in object.properties:
-                self.binder.bind(property, self.updated)
+                self.binder.bind(property.notify, self.updated)
         self.object = object
         self.updated.emit()
 
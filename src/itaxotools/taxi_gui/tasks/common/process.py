@@ -18,7 +18,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from shutil import copytree
 
 from itaxotools.common.utility import AttrDict
 from itaxotools.taxi2.file_types import FileFormat
@@ -36,12 +38,23 @@ def progress_handler(caption, index, total):
 
 
 def get_file_info(path: Path):
+    stat = path.stat()
+    return _get_file_info(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _get_file_info(path: Path, mtime: int, size: int):
     from itaxotools.taxi2.files import get_info
 
     # from time import sleep; sleep(2)
     return get_info(path)
 
 
+def save_results(source: Path, destination: Path) -> Path:
+    copytree(source, destination, dirs_exist_ok=True)
+    return destination
+
+
 def sequences_from_model(input: AttrDict):
     from itaxotools.taxi2.sequences import SequenceHandler, Sequences
 
@@ -33,11 +33,28 @@ from itaxotools.taxi_gui.view.widgets import (
     NoWheelComboBox,
     RadioButtonGroup,
     RichRadioButton,
+    set_pixel_size,
 )
 
 from .types import AlignmentMode, PairwiseScore
 
 
+def _file_size_text(info) -> str:
+    return human_readable_size(info.size)
+
+
+def _spart_type_text(is_xml: bool) -> str:
+    return "Spart-XML" if is_xml else "Spart"
+
+
+def _filter_is_first(filter: ColumnFilter) -> bool:
+    return filter == ColumnFilter.First
+
+
+def _filter_from_checked(checked: bool) -> ColumnFilter:
+    return ColumnFilter.First if checked else ColumnFilter.All
+
+
 class TitleCard(Card):
     def __init__(self, title, description, parent=None):
         super().__init__(parent)
@@ -75,7 +92,7 @@ class DummyResultsCard(Card):
         self.path = Path()
 
         title = QtWidgets.QLabel("Results: ")
-        title.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(title, 16)
         title.setMinimumWidth(120)
 
         path = QtWidgets.QLineEdit()
@@ -120,6 +137,16 @@ class ProgressCard(QtWidgets.QProgressBar):
 
 
 class ColumnFilterDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self._height = None
+        parent.installEventFilter(self)
+
+    def eventFilter(self, object, event):
+        if event.type() in [QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange]:
+            self._height = None
+        return False
+
     def paint(self, painter, option, index):
         if not index.isValid():
             return
@@ -131,8 +158,9 @@ class ColumnFilterDelegate(QtWidgets.QStyledItemDelegate):
         )
 
     def sizeHint(self, option, index):
-        height = self.parent().sizeHint().height()
-        return QtCore.QSize(100, height)
+        if self._height is None:
+            self._height = self.parent().sizeHint().height()
+        return QtCore.QSize(100, self._height)
 
 
 class ColumnFilterCombobox(NoWheelComboBox):
@@ -141,16 +169,11 @@ class ColumnFilterCombobox(NoWheelComboBox):
     DataRole = QtCore.Qt.UserRole
     LabelRole = QtCore.Qt.UserRole + 1
 
+    _shared_model = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        model = QtGui.QStandardItemModel()
-        for filter in ColumnFilter:
-            item = QtGui.QStandardItem()
-            item.setData(filter.abr, QtCore.Qt.DisplayRole)
-            item.setData(filter.label, self.LabelRole)
-            item.setData(filter, self.DataRole)
-            model.appendRow(item)
-        self.setModel(model)
+        self.setModel(self._get_shared_model())
 
         delegate = ColumnFilterDelegate(self)
         self.setItemDelegate(delegate)
@@ -159,6 +182,19 @@ class ColumnFilterCombobox(NoWheelComboBox):
 
         self.currentIndexChanged.connect(self._handle_index_changed)
 
+    @classmethod
+    def _get_shared_model(cls) -> QtGui.QStandardItemModel:
+        if cls._shared_model is None:
+            model = QtGui.QStandardItemModel()
+            for filter in ColumnFilter:
+                item = QtGui.QStandardItem()
+                item.setData(filter.abr, QtCore.Qt.DisplayRole)
+                item.setData(filter.label, cls.LabelRole)
+                item.setData(filter, cls.DataRole)
+                model.appendRow(item)
+            cls._shared_model = model
+        return cls._shared_model
+
     def _handle_index_changed(self, index):
         self.valueChanged.emit(self.itemData(index, self.DataRole))
 
@@ -171,6 +207,9 @@ class InputSelector(Card):
     indexChanged = QtCore.Signal(QtCore.QModelIndex)
     addInputFile = QtCore.Signal(Path)
 
+    # (property, control, setter, signal) entries bound both ways for tabfiles
+    tabfile_bindings: tuple[tuple[str, str, str, str], ...] = ()
+
     def __init__(self, text, parent=None):
         super().__init__(parent)
         self.model = None
@@ -180,7 +219,7 @@ class InputSelector(Card):
 
     def draw_main(self, text):
         label = QtWidgets.QLabel(text + ":")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
         label.setMinimumWidth(140)
 
         combo = NoWheelComboBox()
@@ -216,56 +255,13 @@ class InputSelector(Card):
     def draw_config(self):
         self.controls.config = None
 
-    def set_model(self, model):
-        if model == self.model:
-            return
-        self.controls.combo.setModel(model)
-        self.model = model
-        index = model.index(0, 0)
-        self.set_index(index)
-
-    def set_index(self, index):
-        if not self.model:
-            return
-        if not index or not index.isValid():
-            index = self.model.get_default_index()
-        self.controls.combo.setCurrentIndex(index.row())
-
-    def _handle_index_changed(self, row):
-        if not self.model:
-            return
-        index = self.model.index(row, 0)
-        self.indexChanged.emit(index)
-
-    def _handle_browse(self, *args):
-        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self.window(), f"{app.config.title} - Import Sequence File"
-        )
-        if not filename:
-            return
-        self.addInputFile.emit(Path(filename))
-
-    def bind_object(self, object):
-        self.binder.unbind_all()
-
-    def set_busy(self, busy: bool):
-        self.setEnabled(True)
-        self.controls.combo.setVisible(not busy)
-        self.controls.wait.setVisible(busy)
-        self.controls.browse.setVisible(not busy)
-        self.controls.loading.setVisible(busy)
-        self.controls.label.setEnabled(not busy)
-        self.controls.config.setEnabled(not busy)
-
+    def draw_config_once(self, key: str):
+        if key not in self.controls:
+            getattr(self, f"draw_config_{key}")()
 
-class SequenceSelector(InputSelector):
-    def draw_config(self):
-        self.controls.config = MinimumStackedWidget()
-        self.addWidget(self.controls.config)
-        self.draw_config_tabfile()
-        self.draw_config_fasta()
-
-    def draw_config_tabfile(self):
+    def draw_tabfile_grid(
+        self, top_text: str, bottom_text: str, filters: bool = False
+    ) -> AttrDict:
         layout = QtWidgets.QGridLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
@@ -291,24 +287,39 @@ class SequenceSelector(InputSelector):
         layout.setColumnMinimumWidth(column, 32)
         column += 1
 
-        index_label = QtWidgets.QLabel("Indices:")
-        sequence_label = QtWidgets.QLabel("Sequences:")
+        top_label = QtWidgets.QLabel(f"{top_text}:")
+        bottom_label = QtWidgets.QLabel(f"{bottom_text}:")
 
-        layout.addWidget(index_label, 0, column)
-        layout.addWidget(sequence_label, 1, column)
+        layout.addWidget(top_label, 0, column)
+        layout.addWidget(bottom_label, 1, column)
         column += 1
 
         layout.setColumnMinimumWidth(column, 8)
         column += 1
 
-        index_combo = NoWheelComboBox()
-        sequence_combo = NoWheelComboBox()
+        top_combo = NoWheelComboBox()
+        bottom_combo = NoWheelComboBox()
 
-        layout.addWidget(index_combo, 0, column)
-        layout.addWidget(sequence_combo, 1, column)
+        layout.addWidget(top_combo, 0, column)
+        layout.addWidget(bottom_combo, 1, column)
         layout.setColumnStretch(column, 1)
         column += 1
 
+        grid = AttrDict()
+
+        if filters:
+            top_filter = ColumnFilterCombobox()
+            top_filter.setFixedWidth(40)
+            bottom_filter = ColumnFilterCombobox()
+            bottom_filter.setFixedWidth(40)
+
+            layout.addWidget(top_filter, 0, column)
+            layout.addWidget(bottom_filter, 1, column)
+            column += 1
+
+            grid.top_filter = top_filter
+            grid.bottom_filter = bottom_filter
+
         layout.setColumnMinimumWidth(column, 16)
         column += 1
 
@@ -322,12 +333,86 @@ class SequenceSelector(InputSelector):
         widget = QtWidgets.QWidget()
         widget.setLayout(layout)
 
+        grid.widget = widget
+        grid.top_combo = top_combo
+        grid.bottom_combo = bottom_combo
+        grid.file_size = size_label_value
+        return grid
+
+    def set_model(self, model):
+        if model == self.model:
+            return
+        self.controls.combo.setModel(model)
+        self.model = model
+        index = model.index(0, 0)
+        self.set_index(index)
+
+    def set_index(self, index):
+        if not self.model:
+            return
+        if not index or not index.isValid():
+            index = self.model.get_default_index()
+        with QtCore.QSignalBlocker(self.controls.combo):
+            self.controls.combo.setCurrentIndex(index.row())
+
+    def _handle_index_changed(self, row):
+        if not self.model:
+            return
+        index = self.model.index(row, 0)
+        self.indexChanged.emit(index)
+
+    def _handle_browse(self, *args):
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self.window(), f"{app.config.title} - Import Sequence File"
+        )
+        if not filename:
+            return
+        self.addInputFile.emit(Path(filename))
+
+    def bind_object(self, object):
+        self.binder.unbind_all()
+
+    def _bind_tabfile_controls(self, object):
+        for key, control, setter, signal in self.tabfile_bindings:
+            property = getattr(object.properties, key)
+            widget = self.controls.tabfile[control]
+            self.binder.bind(property, getattr(widget, setter))
+            self.binder.bind(getattr(widget, signal), property)
+        self.binder.bind(
+            object.properties.info,
+            self.controls.tabfile.file_size.setText,
+            _file_size_text,
+        )
+
+    def set_busy(self, busy: bool):
+        self.setEnabled(True)
+        self.controls.combo.setVisible(not busy)
+        self.controls.wait.setVisible(busy)
+        self.controls.browse.setVisible(not busy)
+        self.controls.loading.setVisible(busy)
+        self.controls.label.setEnabled(not busy)
+        self.controls.config.setEnabled(not busy)
+
+
+class SequenceSelector(InputSelector):
+    tabfile_bindings = (
+        ("index_column", "index_combo", "setCurrentIndex", "currentIndexChanged"),
+        ("sequence_column", "sequence_combo", "setCurrentIndex", "currentIndexChanged"),
+    )
+
+    def draw_config(self):
+        self.controls.config = MinimumStackedWidget()
+        self.addWidget(self.controls.config)
+
+    def draw_config_tabfile(self):
+        grid = self.draw_tabfile_grid("Indices", "Sequences")
+
         self.controls.tabfile = AttrDict()
-        self.controls.tabfile.widget = widget
-        self.controls.tabfile.index_combo = index_combo
-        self.controls.tabfile.sequence_combo = sequence_combo
-        self.controls.tabfile.file_size = size_label_value
-        self.controls.config.addWidget(widget)
+        self.controls.tabfile.widget = grid.widget
+        self.controls.tabfile.index_combo = grid.top_combo
+        self.controls.tabfile.sequence_combo = grid.bottom_combo
+        self.controls.tabfile.file_size = grid.file_size
+        self.controls.config.addWidget(grid.widget)
 
     def draw_config_fasta(self):
         type_label = QtWidgets.QLabel("File format:")
@@ -374,32 +459,14 @@ class SequenceSelector(InputSelector):
         self.update()
 
     def _bind_tabfile(self, object):
+        self.draw_config_once("tabfile")
         self._populate_headers(object.info.headers)
-        self.binder.bind(
-            object.properties.index_column,
-            self.controls.tabfile.index_combo.setCurrentIndex,
-        )
-        self.binder.bind(
-            self.controls.tabfile.index_combo.currentIndexChanged,
-            object.properties.index_column,
-        )
-        self.binder.bind(
-            object.properties.sequence_column,
-            self.controls.tabfile.sequence_combo.setCurrentIndex,
-        )
-        self.binder.bind(
-            self.controls.tabfile.sequence_combo.currentIndexChanged,
-            object.properties.sequence_column,
-        )
-        self.binder.bind(
-            object.properties.info,
-            self.controls.tabfile.file_size.setText,
-            lambda info: human_readable_size(info.size),
-        )
+        self._bind_tabfile_controls(object)
         self.controls.config.setCurrentWidget(self.controls.tabfile.widget)
         self.controls.config.setVisible(True)
 
     def _bind_fasta(self, object):
+        self.draw_config_once("fasta")
         self.binder.bind(
             object.properties.has_subsets, self.controls.fasta.parse_organism.setEnabled
         )
@@ -418,7 +485,7 @@ class SequenceSelector(InputSelector):
         self.binder.bind(
             object.properties.info,
             self.controls.fasta.file_size.setText,
-            lambda info: human_readable_size(info.size),
+            _file_size_text,
         )
         self.controls.config.setCurrentWidget(self.controls.fasta.widget)
         self.controls.config.setVisible(True)
@@ -427,14 +494,28 @@ class SequenceSelector(InputSelector):
         self.controls.config.setVisible(False)
 
     def _populate_headers(self, headers):
-        self.controls.tabfile.index_combo.clear()
-        self.controls.tabfile.sequence_combo.clear()
-        for header in headers:
-            self.controls.tabfile.index_combo.addItem(header)
-            self.controls.tabfile.sequence_combo.addItem(header)
+        for combo in [
+            self.controls.tabfile.index_combo,
+            self.controls.tabfile.sequence_combo,
+        ]:
+            with QtCore.QSignalBlocker(combo):
+                combo.clear()
+                combo.addItems(headers)
 
 
 class PartitionSelector(InputSelector):
+    tabfile_bindings = (
+        ("subset_column", "subset_combo", "setCurrentIndex", "currentIndexChanged"),
+        (
+            "individual_column",
+            "individual_combo",
+            "setCurrentIndex",
+            "currentIndexChanged",
+        ),
+        ("subset_filter", "subset_filter", "setValue", "valueChanged"),
+        ("individual_filter", "individual_filter", "setValue", "valueChanged"),
+    )
+
     def __init__(self, text, subset_text=None, individual_text=None, parent=None):
         self._subset_text = subset_text or "Subsets"
         self._individual_text = individual_text or "Individuals"
@@ -443,84 +524,20 @@ class PartitionSelector(InputSelector):
     def draw_config(self):
         self.controls.config = MinimumStackedWidget()
         self.addWidget(self.controls.config)
-        self.draw_config_tabfile()
-        self.draw_config_fasta()
-        self.draw_config_spart()
 
     def draw_config_tabfile(self):
-        layout = QtWidgets.QGridLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-        column = 0
-
-        type_label = QtWidgets.QLabel("File format:")
-        size_label = QtWidgets.QLabel("File size:")
-
-        layout.addWidget(type_label, 0, column)
-        layout.addWidget(size_label, 1, column)
-        column += 1
-
-        layout.setColumnMinimumWidth(column, 8)
-        column += 1
-
-        type_label_value = QtWidgets.QLabel("Tabfile")
-        size_label_value = QtWidgets.QLabel("42 MB")
-
-        layout.addWidget(type_label_value, 0, column)
-        layout.addWidget(size_label_value, 1, column)
-        column += 1
-
-        layout.setColumnMinimumWidth(column, 32)
-        column += 1
-
-        subset_label = QtWidgets.QLabel(f"{self._subset_text}:")
-        individual_label = QtWidgets.QLabel(f"{self._individual_text}:")
-
-        layout.addWidget(subset_label, 0, column)
-        layout.addWidget(individual_label, 1, column)
-        column += 1
-
-        layout.setColumnMinimumWidth(column, 8)
-        column += 1
-
-        subset_combo = NoWheelComboBox()
-        individual_combo = NoWheelComboBox()
-
-        layout.addWidget(subset_combo, 0, column)
-        layout.addWidget(individual_combo, 1, column)
-        layout.setColumnStretch(column, 1)
-        column += 1
-
-        subset_filter = ColumnFilterCombobox()
-        subset_filter.setFixedWidth(40)
-        individual_filter = ColumnFilterCombobox()
-        individual_filter.setFixedWidth(40)
-
-        layout.addWidget(subset_filter, 0, column)
-        layout.addWidget(individual_filter, 1, column)
-        column += 1
-
-        layout.setColumnMinimumWidth(column, 16)
-        column += 1
-
-        view = QtWidgets.QPushButton("View")
-        view.setVisible(False)
-
-        layout.addWidget(view, 0, column)
-        layout.setColumnMinimumWidth(column, 80)
-        column += 1
-
-        widget = QtWidgets.QWidget()
-        widget.setLayout(layout)
+        grid = self.draw_tabfile_grid(
+            self._subset_text, self._individual_text, filters=True
+        )
 
         self.controls.tabfile = AttrDict()
-        self.controls.tabfile.widget = widget
-        self.controls.tabfile.subset_combo = subset_combo
-        self.controls.tabfile.individual_combo = individual_combo
-        self.controls.tabfile.subset_filter = subset_filter
-        self.controls.tabfile.individual_filter = individual_filter
-        self.controls.tabfile.file_size = size_label_value
-        self.controls.config.addWidget(widget)
+        self.controls.tabfile.widget = grid.widget
+        self.controls.tabfile.subset_combo = grid.top_combo
+        self.controls.tabfile.individual_combo = grid.bottom_combo
+        self.controls.tabfile.subset_filter = grid.top_filter
+        self.controls.tabfile.individual_filter = grid.bottom_filter
+        self.controls.tabfile.file_size = grid.file_size
+        self.controls.config.addWidget(grid.widget)
 
     def draw_config_fasta(self):
         type_label = QtWidgets.QLabel("File format:")
@@ -604,93 +621,57 @@ class PartitionSelector(InputSelector):
         self.update()
 
     def _bind_tabfile(self, object):
+        self.draw_config_once("tabfile")
         self._populate_headers(object.info.headers)
-
-        self.binder.bind(
-            object.properties.subset_column,
-            self.controls.tabfile.subset_combo.setCurrentIndex,
-        )
-        self.binder.bind(
-            self.controls.tabfile.subset_combo.currentIndexChanged,
-            object.properties.subset_column,
-        )
-        self.binder.bind(
-            object.properties.individual_column,
-            self.controls.tabfile.individual_combo.setCurrentIndex,
-        )
-        self.binder.bind(
-            self.controls.tabfile.individual_combo.currentIndexChanged,
-            object.properties.individual_column,
-        )
-
-        self.binder.bind(
-            object.properties.subset_filter,
-            self.controls.tabfile.subset_filter.setValue,
-        )
-        self.binder.bind(
-            self.controls.tabfile.subset_filter.valueChanged,
-            object.properties.subset_filter,
-        )
-        self.binder.bind(
-            object.properties.individual_filter,
-            self.controls.tabfile.individual_filter.setValue,
-        )
-        self.binder.bind(
-            self.controls.tabfile.individual_filter.valueChanged,
-            object.properties.individual_filter,
-        )
-
-        self.binder.bind(
-            object.properties.info,
-            self.controls.tabfile.file_size.setText,
-            lambda info: human_readable_size(info.size),
-        )
+        self._bind_tabfile_controls(object)
         self.controls.config.setCurrentWidget(self.controls.tabfile.widget)
         self.controls.config.setVisible(True)
 
     def _bind_fasta(self, object):
+        self.draw_config_once("fasta")
         self.binder.bind(
             object.properties.subset_filter,
             self.controls.fasta.filter_first.setChecked,
-            lambda x: x == ColumnFilter.First,
+            _filter_is_first,
         )
         self.binder.bind(
             self.controls.fasta.filter_first.toggled,
             object.properties.subset_filter,
-            lambda x: ColumnFilter.First if x else ColumnFilter.All,
+            _filter_from_checked,
         )
 
         self.binder.bind(
             object.properties.info,
             self.controls.fasta.file_size.setText,
-            lambda info: human_readable_size(info.size),
+            _file_size_text,
         )
         self.controls.config.setCurrentWidget(self.controls.fasta.widget)
         self.controls.config.setVisible(True)
 
     def _bind_spart(self, object):
+        self.draw_config_once("spart")
         self._populate_spartitions(object.info.spartitions)
 
         self.binder.bind(
             object.properties.is_xml,
             self.controls.spart.file_type.setText,
-            lambda x: "Spart-XML" if x else "Spart",
+            _spart_type_text,
         )
         self.binder.bind(
             self.controls.spart.spartition.currentIndexChanged,
             object.properties.spartition,
-            lambda x: self.controls.spart.spartition.itemData(x),
+            self.controls.spart.spartition.itemText,
         )
         self.binder.bind(
             object.properties.spartition,
             self.controls.spart.spartition.setCurrentIndex,
-            lambda x: self.controls.spart.spartition.findText(x),
+            self.controls.spart.spartition.findText,
         )
 
         self.binder.bind(
             object.properties.info,
             self.controls.spart.file_size.setText,
-            lambda info: human_readable_size(info.size),
+            _file_size_text,
         )
         self.controls.config.setCurrentWidget(self.controls.spart.widget)
         self.controls.config.setVisible(True)
@@ -699,16 +680,19 @@ class PartitionSelector(InputSelector):
         self.controls.config.setVisible(False)
 
     def _populate_headers(self, headers):
-        self.controls.tabfile.subset_combo.clear()
-        self.controls.tabfile.individual_combo.clear()
-        for header in headers:
-            self.controls.tabfile.subset_combo.addItem(header)
-            self.controls.tabfile.individual_combo.addItem(header)
+        for combo in [
+            self.controls.tabfile.subset_combo,
+            self.controls.tabfile.individual_combo,
+        ]:
+            with QtCore.QSignalBlocker(combo):
+                combo.clear()
+                combo.addItems(headers)
 
     def _populate_spartitions(self, spartitions: list[str]):
-        self.controls.spart.spartition.clear()
-        for spartition in spartitions:
-            self.controls.spart.spartition.addItem(spartition, spartition)
+        combo = self.controls.spart.spartition
+        with QtCore.QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems(spartitions)
 
 
 class AlignmentModeSelector(Card):
@@ -722,7 +706,7 @@ class AlignmentModeSelector(Card):
 
     def draw_main(self):
         label = QtWidgets.QLabel("Sequence alignment")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "You may optionally align sequences before calculating distances."
@@ -755,12 +739,11 @@ class AlignmentModeSelector(Card):
 
         self.controls.score_fields = dict()
         scores = QtWidgets.QGridLayout()
-        validator = QtGui.QIntValidator()
+        validator = QtGui.QIntValidator(-999, 999, self)
         for i, score in enumerate(PairwiseScore):
             label = QtWidgets.QLabel(f"{score.label}:")
             field = GLineEdit()
             field.setValidator(validator)
-            field.scoreKey = score.key
             scores.addWidget(label, i // 2, (i % 2) * 4)
             scores.addWidget(field, i // 2, (i % 2) * 4 + 2)
             self.controls.score_fields[score.key] = field
@@ -794,13 +777,6 @@ class AlignmentModeSelector(Card):
 
         self.controls.pairwise_config = widget
 
-    def handleToggle(self, checked):
-        if not checked:
-            return
-        for button in self.controls.radio_buttons:
-            if button.isChecked():
-                self.toggled.emit(button.alignmentMode)
-
     def handleModeChanged(self, mode):
         self.controls.pairwise_config.roll.setAnimatedVisible(
             mode == AlignmentMode.PairwiseAlignment
@@ -192,27 +192,6 @@ class Model(TaskModel):
     def onDoneInfoIngroup(self, info):
         self.ingroup_sequences.add_info(info)
 
-    def onStop(self, report):
-        super().onStop(report)
-        self.busy_main = False
-        self.busy_input = False
-        self.busy_outgroup = False
-        self.busy_ingroup = False
-
-    def onFail(self, report):
-        super().onFail(report)
-        self.busy_main = False
-        self.busy_input = False
-        self.busy_outgroup = False
-        self.busy_ingroup = False
-
-    def onError(self, report):
-        super().onError(report)
-        self.busy_main = False
-        self.busy_input = False
-        self.busy_outgroup = False
-        self.busy_ingroup = False
-
     def clear(self):
         self.dummy_results = None
         self.dummy_time = None
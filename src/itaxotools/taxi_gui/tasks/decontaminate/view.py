@@ -18,8 +18,10 @@
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from functools import partial
+
 from itaxotools.common.utility import AttrDict
-from itaxotools.taxi_gui.utility import type_convert
+from itaxotools.taxi_gui.utility import float_or_none, int_or_none, str_or_empty
 from itaxotools.taxi_gui.view.cards import Card
 from itaxotools.taxi_gui.view.tasks import ScrollTaskView
 from itaxotools.taxi_gui.view.widgets import (
@@ -27,6 +29,7 @@ from itaxotools.taxi_gui.view.widgets import (
     GSpinBox,
     NoWheelRadioButton,
     RadioButtonGroup,
+    set_pixel_size,
 )
 
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
@@ -47,7 +50,7 @@ class DecontaminateModeSelector(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Decontamination Mode")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "Decontamination is performed either against a single or a double reference. "
@@ -71,18 +74,15 @@ class DecontaminateModeSelector(Card):
         for mode in DecontaminateMode:
             button = QtWidgets.QRadioButton(f"{str(mode)}\t\t{texts[mode]}")
             button.decontaminate_mode = mode
-            button.toggled.connect(self.handleToggle)
+            button.toggled.connect(partial(self.handleToggle, mode))
             self.radio_buttons.append(button)
             layout.addWidget(button)
 
         self.addLayout(layout)
 
-    def handleToggle(self, checked):
-        if not checked:
-            return
-        for button in self.radio_buttons:
-            if button.isChecked():
-                self.toggled.emit(button.decontaminate_mode)
+    def handleToggle(self, mode, checked):
+        if checked:
+            self.toggled.emit(mode)
 
     def setDecontaminateMode(self, mode):
         for button in self.radio_buttons:
@@ -97,7 +97,7 @@ class ReferenceWeightSelector(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Reference Weights")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "In order to determine whether a sequence is a contaminant or not, "
@@ -181,7 +181,7 @@ class DistanceMetricSelector(Card):
 
     def draw_main(self):
         label = QtWidgets.QLabel("Distance metric")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "Select the type of distances that should be calculated for each pair of sequences:"
@@ -341,7 +341,7 @@ class SimilarityThresholdCard(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Similarity Threshold")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         threshold = GLineEdit()
         threshold.setFixedWidth(80)
@@ -378,7 +378,7 @@ class IdentityThresholdCard(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Identity Threshold")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         threshold = GSpinBox()
         threshold.setMinimum(0)
@@ -508,12 +508,12 @@ class View(ScrollTaskView):
                     score.key
                 ].textEditedSafe,
                 object.pairwise_scores.properties[score.key],
-                lambda x: type_convert(x, int, None),
+                int_or_none,
             )
             self.binder.bind(
                 object.pairwise_scores.properties[score.key],
                 self.cards.alignment_mode.controls.score_fields[score.key].setText,
-                lambda x: str(x) if x is not None else "",
+                str_or_empty,
             )
 
         self.binder.bind(
@@ -528,12 +528,12 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.distance_metrics.controls.bbc_k.textEditedSafe,
             object.properties.distance_metric_bbc_k,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.properties.distance_metric_bbc_k,
             self.cards.distance_metrics.controls.bbc_k.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             object.properties.distance_metric,
@@ -575,12 +575,12 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.distance_metrics.controls.precision.textEditedSafe,
             object.properties.distance_precision,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.properties.distance_precision,
             self.cards.distance_metrics.controls.precision.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             self.cards.distance_metrics.controls.missing.textEditedSafe,
@@ -604,7 +604,7 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.similarity.controls.similarityThreshold.textEditedSafe,
             object.properties.similarity_threshold,
-            lambda x: type_convert(x, float, None),
+            float_or_none,
         )
 
         self.binder.bind(
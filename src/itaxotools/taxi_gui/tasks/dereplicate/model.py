@@ -33,12 +33,13 @@ from . import process
 
 class PairwiseScores(EnumObject):
     enum = PairwiseScore
+    _keys = tuple(score.key for score in PairwiseScore)
 
     def as_dict(self):
-        return {score.key: self.properties[score.key].value for score in self.enum}
+        return {key: self.properties[key].value for key in self._keys}
 
     def is_valid(self):
-        return not any(self.properties[score.key].value is None for score in self.enum)
+        return all(self.properties[key].value is not None for key in self._keys)
 
 
 class Model(TaskModel):
@@ -153,28 +154,12 @@ class Model(TaskModel):
         )
         self.dummy_results = report.result.output_directory
         self.dummy_time = report.result.seconds_taken
-        self.busy_main = False
         self.busy = False
         self.done = True
 
     def onDoneInfoSequences(self, info):
         self.input_sequences.add_info(info)
 
-    def onStop(self, report):
-        super().onStop(report)
-        self.busy_main = False
-        self.busy_sequence = False
-
-    def onFail(self, report):
-        super().onFail(report)
-        self.busy_main = False
-        self.busy_sequence = False
-
-    def onError(self, report):
-        super().onError(report)
-        self.busy_main = False
-        self.busy_sequence = False
-
     def clear(self):
         self.dummy_results = None
         self.dummy_time = None
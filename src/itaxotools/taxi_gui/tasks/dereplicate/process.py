@@ -32,11 +32,23 @@ class DereplicateResults:
     pass
 
 
+_Dereplicate = None
+_Scores = None
+_BackendDistanceMetric = None
+
+
 def initialize():
+    global _Dereplicate, _Scores, _BackendDistanceMetric
     import itaxotools
 
     itaxotools.progress_handler("Initializing...")
-    from itaxotools.taxi2.tasks.dereplicate import Dereplicate  # noqa
+    from itaxotools.taxi2.align import Scores
+    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
+    from itaxotools.taxi2.tasks.dereplicate import Dereplicate
+
+    _Dereplicate = Dereplicate
+    _Scores = Scores
+    _BackendDistanceMetric = BackendDistanceMetric
 
 
 def execute(
@@ -56,11 +68,10 @@ def execute(
     length_threshold: int,
     **kwargs,
 ) -> tuple[Path, float]:
-    from itaxotools.taxi2.align import Scores
-    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
-    from itaxotools.taxi2.tasks.dereplicate import Dereplicate
+    if _Dereplicate is None:
+        initialize()
 
-    task = Dereplicate()
+    task = _Dereplicate()
     task.work_dir = work_dir
     task.progress_handler = progress_handler
 
@@ -71,19 +82,19 @@ def execute(
     task.params.thresholds.length = length_threshold
 
     task.params.pairs.align = bool(alignment_mode == AlignmentMode.PairwiseAlignment)
-    task.params.pairs.scores = Scores(**alignment_pairwise_scores)
+    task.params.pairs.scores = _Scores(**alignment_pairwise_scores)
     task.params.pairs.write = alignment_write_pairs
 
     metrics_tr = {
-        DistanceMetric.Uncorrected: (BackendDistanceMetric.Uncorrected, []),
+        DistanceMetric.Uncorrected: (_BackendDistanceMetric.Uncorrected, []),
         DistanceMetric.UncorrectedWithGaps: (
-            BackendDistanceMetric.UncorrectedWithGaps,
+            _BackendDistanceMetric.UncorrectedWithGaps,
             [],
         ),
-        DistanceMetric.JukesCantor: (BackendDistanceMetric.JukesCantor, []),
-        DistanceMetric.Kimura2Parameter: (BackendDistanceMetric.Kimura2P, []),
-        DistanceMetric.NCD: (BackendDistanceMetric.NCD, []),
-        DistanceMetric.BBC: (BackendDistanceMetric.BBC, [distance_metric_bbc_k]),
+        DistanceMetric.JukesCantor: (_BackendDistanceMetric.JukesCantor, []),
+        DistanceMetric.Kimura2Parameter: (_BackendDistanceMetric.Kimura2P, []),
+        DistanceMetric.NCD: (_BackendDistanceMetric.NCD, []),
+        DistanceMetric.BBC: (_BackendDistanceMetric.BBC, [distance_metric_bbc_k]),
     }
     metric = metrics_tr[distance_metric][0](*metrics_tr[distance_metric][1])
 
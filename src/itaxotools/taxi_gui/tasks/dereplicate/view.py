@@ -18,8 +18,13 @@
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from itaxotools.common.utility import AttrDict
-from itaxotools.taxi_gui.utility import type_convert
+from itaxotools.common.utility import AttrDict, Guard
+from itaxotools.taxi_gui.utility import (
+    float_or_none,
+    int_or_none,
+    str_or_empty,
+    type_convert,
+)
 from itaxotools.taxi_gui.view.cards import Card
 from itaxotools.taxi_gui.view.tasks import ScrollTaskView
 from itaxotools.taxi_gui.view.widgets import (
@@ -27,6 +32,7 @@ from itaxotools.taxi_gui.view.widgets import (
     GSpinBox,
     NoWheelRadioButton,
     RadioButtonGroup,
+    set_pixel_size,
 )
 
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
@@ -48,7 +54,7 @@ class DistanceMetricSelector(Card):
 
     def draw_main(self):
         label = QtWidgets.QLabel("Distance metric")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "Select the type of distances that should be calculated for each pair of sequences:"
@@ -208,7 +214,7 @@ class SimilarityThresholdCard(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Similarity Threshold")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         threshold = GLineEdit()
         threshold.setFixedWidth(80)
@@ -245,7 +251,7 @@ class IdentityThresholdCard(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Identity Threshold")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         threshold = GSpinBox()
         threshold.setMinimum(0)
@@ -278,7 +284,7 @@ class LengthThresholdCard(Card):
         super().__init__(parent)
 
         label = QtWidgets.QLabel("Length Threshold")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         threshold = GLineEdit("0")
         threshold.setFixedWidth(80)
@@ -307,6 +313,7 @@ class LengthThresholdCard(Card):
 class View(ScrollTaskView):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._similarity_guard = Guard()
         self.draw()
 
     def draw(self):
@@ -337,13 +344,18 @@ class View(ScrollTaskView):
         self.object = object
         self.binder.unbind_all()
 
+        props = object.properties
+        ps_props = object.pairwise_scores.properties
+        am_ctl = self.cards.alignment_mode.controls
+        dm_ctl = self.cards.distance_metrics.controls
+
         self.binder.bind(object.notification, self.showNotification)
         self.binder.bind(object.progression, self.cards.progress.showProgress)
 
-        self.binder.bind(object.properties.name, self.cards.title.setTitle)
-        self.binder.bind(object.properties.busy, self.cards.title.setBusy)
-        self.binder.bind(object.properties.busy, self.cards.progress.setEnabled)
-        self.binder.bind(object.properties.busy, self.cards.progress.setVisible)
+        self.binder.bind(props.name, self.cards.title.setTitle)
+        self.binder.bind(props.busy, self.cards.title.setBusy)
+        self.binder.bind(props.busy, self.cards.progress.setEnabled)
+        self.binder.bind(props.busy, self.cards.progress.setVisible)
         self.binder.bind(
             object.subtask_sequences.properties.busy,
             self.cards.input_sequences.set_busy,
@@ -353,164 +365,113 @@ class View(ScrollTaskView):
             self.cards.input_sequences, object.input_sequences, object.subtask_sequences
         )
 
-        self.binder.bind(
-            self.cards.alignment_mode.controls.mode.valueChanged,
-            object.properties.alignment_mode,
-        )
-        self.binder.bind(
-            object.properties.alignment_mode,
-            self.cards.alignment_mode.controls.mode.setValue,
-        )
-        self.binder.bind(
-            self.cards.alignment_mode.controls.write_pairs.toggled,
-            object.properties.alignment_write_pairs,
-        )
-        self.binder.bind(
-            object.properties.alignment_write_pairs,
-            self.cards.alignment_mode.controls.write_pairs.setChecked,
-        )
+        self.binder.bind(am_ctl.mode.valueChanged, props.alignment_mode)
+        self.binder.bind(props.alignment_mode, am_ctl.mode.setValue)
+        self.binder.bind(am_ctl.write_pairs.toggled, props.alignment_write_pairs)
+        self.binder.bind(props.alignment_write_pairs, am_ctl.write_pairs.setChecked)
         self.binder.bind(
             self.cards.alignment_mode.resetScores, object.pairwise_scores.reset
         )
         for score in PairwiseScore:
             self.binder.bind(
-                self.cards.alignment_mode.controls.score_fields[
-                    score.key
-                ].textEditedSafe,
-                object.pairwise_scores.properties[score.key],
-                lambda x: type_convert(x, int, None),
+                am_ctl.score_fields[score.key].textEditedSafe,
+                ps_props[score.key],
+                int_or_none,
             )
             self.binder.bind(
-                object.pairwise_scores.properties[score.key],
-                self.cards.alignment_mode.controls.score_fields[score.key].setText,
-                lambda x: str(x) if x is not None else "",
+                ps_props[score.key],
+                am_ctl.score_fields[score.key].setText,
+                str_or_empty,
             )
 
-        self.binder.bind(
-            object.properties.distance_metric,
-            self.cards.distance_metrics.controls.group.setValue,
-        )
-        self.binder.bind(
-            self.cards.distance_metrics.controls.group.valueChanged,
-            object.properties.distance_metric,
-        )
+        self.binder.bind(props.distance_metric, dm_ctl.group.setValue)
+        self.binder.bind(dm_ctl.group.valueChanged, props.distance_metric)
 
         self.binder.bind(
-            self.cards.distance_metrics.controls.bbc_k.textEditedSafe,
-            object.properties.distance_metric_bbc_k,
-            lambda x: type_convert(x, int, None),
+            dm_ctl.bbc_k.textEditedSafe,
+            props.distance_metric_bbc_k,
+            int_or_none,
         )
         self.binder.bind(
-            object.properties.distance_metric_bbc_k,
-            self.cards.distance_metrics.controls.bbc_k.setText,
-            lambda x: str(x) if x is not None else "",
+            props.distance_metric_bbc_k,
+            dm_ctl.bbc_k.setText,
+            str_or_empty,
         )
         self.binder.bind(
-            object.properties.distance_metric,
-            self.cards.distance_metrics.controls.bbc_k.setEnabled,
+            props.distance_metric,
+            dm_ctl.bbc_k.setEnabled,
             lambda x: x == DistanceMetric.BBC,
         )
         self.binder.bind(
-            object.properties.distance_metric,
-            self.cards.distance_metrics.controls.bbc_k_label.setEnabled,
+            props.distance_metric,
+            dm_ctl.bbc_k_label.setEnabled,
             lambda x: x == DistanceMetric.BBC,
         )
 
-        self.binder.bind(
-            self.cards.distance_metrics.controls.write_linear.toggled,
-            object.properties.distance_linear,
-        )
-        self.binder.bind(
-            object.properties.distance_linear,
-            self.cards.distance_metrics.controls.write_linear.setChecked,
-        )
-        self.binder.bind(
-            self.cards.distance_metrics.controls.write_matricial.toggled,
-            object.properties.distance_matricial,
-        )
-        self.binder.bind(
-            object.properties.distance_matricial,
-            self.cards.distance_metrics.controls.write_matricial.setChecked,
-        )
+        self.binder.bind(dm_ctl.write_linear.toggled, props.distance_linear)
+        self.binder.bind(props.distance_linear, dm_ctl.write_linear.setChecked)
+        self.binder.bind(dm_ctl.write_matricial.toggled, props.distance_matricial)
+        self.binder.bind(props.distance_matricial, dm_ctl.write_matricial.setChecked)
 
-        self.binder.bind(
-            self.cards.distance_metrics.controls.percentile.valueChanged,
-            object.properties.distance_percentile,
-        )
-        self.binder.bind(
-            object.properties.distance_percentile,
-            self.cards.distance_metrics.controls.percentile.setValue,
-        )
+        self.binder.bind(dm_ctl.percentile.valueChanged, props.distance_percentile)
+        self.binder.bind(props.distance_percentile, dm_ctl.percentile.setValue)
 
         self.binder.bind(
-            self.cards.distance_metrics.controls.precision.textEditedSafe,
-            object.properties.distance_precision,
-            lambda x: type_convert(x, int, None),
+            dm_ctl.precision.textEditedSafe,
+            props.distance_precision,
+            int_or_none,
         )
         self.binder.bind(
-            object.properties.distance_precision,
-            self.cards.distance_metrics.controls.precision.setText,
-            lambda x: str(x) if x is not None else "",
-        )
-        self.binder.bind(
-            self.cards.distance_metrics.controls.missing.textEditedSafe,
-            object.properties.distance_missing,
-        )
-        self.binder.bind(
-            object.properties.distance_missing,
-            self.cards.distance_metrics.controls.missing.setText,
+            props.distance_precision,
+            dm_ctl.precision.setText,
+            str_or_empty,
         )
+        self.binder.bind(dm_ctl.missing.textEditedSafe, props.distance_missing)
+        self.binder.bind(props.distance_missing, dm_ctl.missing.setText)
 
         self.binder.bind(
-            object.properties.alignment_mode,
+            props.alignment_mode,
             self.cards.distance_metrics.setAlignmentMode,
         )
 
         self.binder.bind(
-            object.properties.similarity_threshold,
+            props.similarity_threshold,
             self.cards.similarity.controls.similarityThreshold.setText,
             lambda x: f"{x:.2f}",
         )
         self.binder.bind(
             self.cards.similarity.controls.similarityThreshold.textEditedSafe,
-            object.properties.similarity_threshold,
-            lambda x: type_convert(x, float, None),
+            props.similarity_threshold,
+            float_or_none,
         )
 
-        self.binder.bind(
-            object.properties.similarity_threshold,
-            self.cards.identity.controls.identityThreshold.setValue,
-            lambda x: 100 - round(x * 100),
-        )
+        self.binder.bind(props.similarity_threshold, self._set_identity_from_similarity)
         self.binder.bind(
             self.cards.identity.controls.identityThreshold.valueChangedSafe,
-            object.properties.similarity_threshold,
-            lambda x: (100 - x) / 100,
+            self._set_similarity_from_identity,
         )
 
         self.binder.bind(
-            object.properties.length_threshold,
+            props.length_threshold,
             self.cards.length.controls.lengthThreshold.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             self.cards.length.controls.lengthThreshold.textEditedSafe,
-            object.properties.length_threshold,
+            props.length_threshold,
             lambda x: type_convert(x, int, 0),
         )
 
+        self.binder.bind(props.dummy_results, self.cards.dummy_results.setPath)
         self.binder.bind(
-            object.properties.dummy_results, self.cards.dummy_results.setPath
-        )
-        self.binder.bind(
-            object.properties.dummy_results,
+            props.dummy_results,
             self.cards.dummy_results.setVisible,
             lambda x: x is not None,
         )
 
-        self.binder.bind(object.properties.distance_metric, self.update_visible_cards)
+        self.binder.bind(props.distance_metric, self.update_visible_cards)
 
-        self.binder.bind(object.properties.editable, self.setEditable)
+        self.binder.bind(props.editable, self.setEditable)
 
     def _bind_input_selector(self, card, object, subtask):
         self.binder.bind(card.addInputFile, subtask.start)
@@ -519,6 +480,19 @@ class View(ScrollTaskView):
         self.binder.bind(object.properties.index, card.set_index)
         self.binder.bind(object.properties.object, card.bind_object)
 
+    def _set_identity_from_similarity(self, similarity: float | None):
+        if self._similarity_guard or similarity is None:
+            return
+        identity = self.cards.identity.controls.identityThreshold
+        with self._similarity_guard, QtCore.QSignalBlocker(identity):
+            identity.setValue(100 - round(similarity * 100))
+
+    def _set_similarity_from_identity(self, identity: int):
+        if self._similarity_guard:
+            return
+        with self._similarity_guard:
+            self.object.similarity_threshold = (100 - identity) / 100
+
     def update_visible_cards(self, *args, **kwargs):
         uncorrected = any(
             (
@@ -18,16 +18,21 @@
 
 from datetime import datetime
 from pathlib import Path
-from shutil import copytree
 
 from itaxotools.common.bindings import Binder, EnumObject, Instance, Property
+from itaxotools.common.utility import Guard
 from itaxotools.taxi_gui.model.partition import PartitionModel
 from itaxotools.taxi_gui.model.sequence import SequenceModel
 from itaxotools.taxi_gui.model.tasks import SubtaskModel, TaskModel
-from itaxotools.taxi_gui.types import FileFormat, Notification
+from itaxotools.taxi_gui.types import FileFormat, FileInfo, Notification
 from itaxotools.taxi_gui.utility import human_readable_seconds
 
-from ..common.model import FileInfoSubtaskModel, ImportedInputModel, ItemProxyModel
+from ..common.model import (
+    FileInfoSubtaskModel,
+    ImportedInputModel,
+    ItemProxyModel,
+    SaveSubtaskModel,
+)
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
 from . import process
 from .types import StatisticsGroup
@@ -35,12 +40,29 @@ from .types import StatisticsGroup
 
 class PairwiseScores(EnumObject):
     enum = PairwiseScore
+    _keys = tuple(score.key for score in PairwiseScore)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+        for property in self.properties:
+            property.notify.connect(self._invalidate)
+
+    def _invalidate(self, *args):
+        self._cached_dict = None
+        self._cached_valid = None
 
     def as_dict(self):
-        return {score.key: self.properties[score.key].value for score in self.enum}
+        if self._cached_dict is None:
+            self._cached_dict = {key: self.properties[key].value for key in self._keys}
+        return dict(self._cached_dict)
 
     def is_valid(self):
-        return not any(self.properties[score.key].value is None for score in self.enum)
+        if self._cached_valid is None:
+            self._cached_valid = all(
+                value is not None for value in self.as_dict().values()
+            )
+        return self._cached_valid
 
 
 class DistanceMetrics(EnumObject):
@@ -48,8 +70,21 @@ class DistanceMetrics(EnumObject):
 
     bbc_k = Property(int | None, 10)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+        for property in self.properties:
+            property.notify.connect(self._invalidate)
+
+    def _invalidate(self, *args):
+        self._cached_list = None
+
     def as_list(self):
-        return [field for field in self.enum if self.properties[field.key].value]
+        if self._cached_list is None:
+            self._cached_list = tuple(
+                field for field in self.enum if self.properties[field.key].value
+            )
+        return list(self._cached_list)
 
 
 class StatisticsGroups(EnumObject):
@@ -89,20 +124,41 @@ class Model(TaskModel):
     plot_binwidth = Property(float, 0.05)
 
     dummy_results = Property(Path, None)
-    dummy_time = Property(float, None)
+
+    _param_keys = (
+        "perform_species",
+        "perform_genera",
+        "alignment_mode",
+        "alignment_write_pairs",
+        "distance_linear",
+        "distance_matricial",
+        "distance_percentile",
+        "distance_precision",
+        "distance_missing",
+        "distance_stats_template",
+        "plot_histograms",
+        "plot_binwidth",
+    )
 
     def __init__(self, name=None):
         super().__init__(name)
         self.binder = Binder()
+        self.dummy_time: float | None = None
+
+        self._params = None
+        for property in self._param_properties():
+            property.notify.connect(self._invalidate_params)
 
         self.subtask_init = SubtaskModel(self, bind_busy=False)
         self.subtask_sequences = FileInfoSubtaskModel(self)
         self.subtask_species = FileInfoSubtaskModel(self)
         self.subtask_genera = FileInfoSubtaskModel(self)
+        self.subtask_save = SaveSubtaskModel(self)
 
         self.binder.bind(self.subtask_sequences.done, self.onDoneInfoSequences)
         self.binder.bind(self.subtask_species.done, self.onDoneInfoSpecies)
         self.binder.bind(self.subtask_genera.done, self.onDoneInfoGenera)
+        self.binder.bind(self.subtask_save.done, self.onDoneSave)
 
         self.binder.bind(self.input_sequences.notification, self.notification)
         self.binder.bind(self.input_species.notification, self.notification)
@@ -112,61 +168,93 @@ class Model(TaskModel):
             self.input_sequences.properties.index, self.propagate_input_index
         )
 
-        for handle in [
-            self.properties.busy_subtask,
-            self.properties.perform_species,
-            self.properties.perform_genera,
-            self.properties.alignment_mode,
-            *(property for property in self.pairwise_scores.properties),
-            self.distance_metrics.properties.bbc,
-            self.distance_metrics.properties.bbc_k,
-            self.properties.distance_precision,
-            self.input_sequences.updated,
-            self.input_species.updated,
-            self.input_genera.updated,
-        ]:
-            self.binder.bind(handle, self.checkReady)
+        self._ready_triggers = None
+        self._ready_guard = Guard()
+        with self._ready_guard:
+            for handle in self.readyTriggers():
+                self.binder.bind(handle, self.checkReady)
+        self.checkReady()
 
         self.subtask_init.start(process.initialize)
 
+    def readyTriggers(self):
+        if self._ready_triggers is None:
+            self._ready_triggers = [
+                self.properties.busy_subtask,
+                self.properties.perform_species,
+                self.properties.perform_genera,
+                self.properties.alignment_mode,
+                *self.pairwise_scores.properties,
+                self.distance_metrics.properties.bbc,
+                self.distance_metrics.properties.bbc_k,
+                self.properties.distance_precision,
+                self.input_sequences.updated,
+                self.input_species.updated,
+                self.input_genera.updated,
+            ]
+        return self._ready_triggers
+
+    def checkReady(self):
+        if self._ready_guard:
+            return
+        super().checkReady()
+
     def isReady(self):
-        if self.busy_subtask:
+        if self.busy_subtask or self.distance_precision is None:
+            return False
+        if self.distance_metrics.bbc and self.distance_metrics.bbc_k is None:
             return False
         if not self.input_sequences.is_valid():
             return False
-        if self.perform_species:
-            if not self.input_species.is_valid():
-                return False
-        if self.perform_genera:
-            if not self.input_genera.is_valid():
-                return False
+        if not self._partition_ready(self.perform_species, self.input_species):
+            return False
+        if not self._partition_ready(self.perform_genera, self.input_genera):
+            return False
         if self.perform_species and self.perform_genera:
             if self.input_species.object == self.input_genera.object:
                 return False
         if self.alignment_mode == AlignmentMode.PairwiseAlignment:
             if not self.pairwise_scores.is_valid():
                 return False
-        if self.distance_metrics.bbc:
-            if self.distance_metrics.bbc_k is None:
-                return False
-        if self.distance_precision is None:
-            return False
         return True
 
+    @staticmethod
+    def _partition_ready(perform: bool, input: ImportedInputModel) -> bool:
+        return not perform or input.is_valid()
+
     def start(self):
         super().start()
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         work_dir = self.temporary_path / timestamp
-        work_dir.mkdir()
 
         self.exec(
             process.execute,
             work_dir=work_dir,
-            perform_species=self.perform_species,
-            perform_genera=self.perform_genera,
             input_sequences=self.input_sequences.as_dict(),
             input_species=self.input_species.as_dict(),
             input_genera=self.input_genera.as_dict(),
+            **self._get_params(),
+        )
+
+    def _get_params(self) -> dict:
+        if self._params is None:
+            self._params = self._build_params()
+        return self._params
+
+    def _param_properties(self):
+        for key in self._param_keys:
+            yield self.properties[key]
+        yield from self.pairwise_scores.properties
+        yield from self.distance_metrics.properties
+        yield from self.statistics_groups.properties
+
+    def _invalidate_params(self, *args):
+        self._params = None
+
+    def _build_params(self) -> dict:
+        return dict(
+            perform_species=self.perform_species,
+            perform_genera=self.perform_genera,
             alignment_mode=self.alignment_mode,
             alignment_write_pairs=self.alignment_write_pairs,
             alignment_pairwise_scores=self.pairwise_scores.as_dict(),
@@ -198,20 +286,29 @@ class Model(TaskModel):
             return
 
         info = item.object.info
-
-        if info.format == FileFormat.Tabfile:
-            if info.header_species is not None or info.header_organism is not None:
-                self.perform_species = True
-                self.input_species.set_index(index)
-            if info.header_genus is not None or info.header_organism is not None:
-                self.perform_genera = True
-                self.input_genera.set_index(index)
-        elif info.format == FileFormat.Fasta:
-            if info.has_subsets:
-                self.input_species.set_index(index)
-                self.input_genera.set_index(index)
-                self.perform_species = True
-                self.perform_genera = True
+        handler = self._propagate_handlers.get(info.format)
+        if handler is not None:
+            handler(self, index, info)
+
+    def _propagate_tabfile_index(self, index, info: FileInfo.Tabfile):
+        if info.header_species is not None or info.header_organism is not None:
+            self.perform_species = True
+            self.input_species.set_index(index)
+        if info.header_genus is not None or info.header_organism is not None:
+            self.perform_genera = True
+            self.input_genera.set_index(index)
+
+    def _propagate_fasta_index(self, index, info: FileInfo.Fasta):
+        if info.has_subsets:
+            self.input_species.set_index(index)
+            self.input_genera.set_index(index)
+            self.perform_species = True
+            self.perform_genera = True
+
+    _propagate_handlers = {
+        FileFormat.Tabfile: _propagate_tabfile_index,
+        FileFormat.Fasta: _propagate_fasta_index,
+    }
 
     def onDone(self, report):
         time_taken = human_readable_seconds(report.result.seconds_taken)
@@ -240,5 +337,7 @@ class Model(TaskModel):
         self.done = False
 
     def save(self, destination: Path):
-        copytree(self.dummy_results, destination, dirs_exist_ok=True)
+        self.subtask_save.start(self.dummy_results, destination)
+
+    def onDoneSave(self, destination: Path):
         self.notification.emit(Notification.Info("Saved files successfully!"))
@@ -36,11 +36,57 @@ class VersusAllResults:
     pass
 
 
+_metrics_filter = {
+    AlignmentMode.NoAlignment: frozenset(
+        {
+            DistanceMetric.Uncorrected,
+            DistanceMetric.UncorrectedWithGaps,
+            DistanceMetric.JukesCantor,
+            DistanceMetric.Kimura2Parameter,
+            DistanceMetric.NCD,
+            DistanceMetric.BBC,
+        }
+    ),
+    AlignmentMode.PairwiseAlignment: frozenset(
+        {
+            DistanceMetric.Uncorrected,
+            DistanceMetric.UncorrectedWithGaps,
+            DistanceMetric.JukesCantor,
+            DistanceMetric.Kimura2Parameter,
+        }
+    ),
+    AlignmentMode.AlignmentFree: frozenset(
+        {
+            DistanceMetric.NCD,
+            DistanceMetric.BBC,
+        }
+    ),
+}
+
+_VersusAll = None
+_Scores = None
+_metrics_tr = None
+
+
 def initialize():
+    global _VersusAll, _Scores, _metrics_tr
     import itaxotools
 
     itaxotools.progress_handler("Initializing...")
-    from itaxotools.taxi2.tasks.versus_all import VersusAll  # noqa
+    from itaxotools.taxi2.align import Scores
+    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
+    from itaxotools.taxi2.tasks.versus_all import VersusAll
+
+    _VersusAll = VersusAll
+    _Scores = Scores
+    _metrics_tr = {
+        DistanceMetric.Uncorrected: BackendDistanceMetric.Uncorrected,
+        DistanceMetric.UncorrectedWithGaps: BackendDistanceMetric.UncorrectedWithGaps,
+        DistanceMetric.JukesCantor: BackendDistanceMetric.JukesCantor,
+        DistanceMetric.Kimura2Parameter: BackendDistanceMetric.Kimura2P,
+        DistanceMetric.NCD: BackendDistanceMetric.NCD,
+        DistanceMetric.BBC: BackendDistanceMetric.BBC,
+    }
 
 
 def execute(
@@ -68,13 +114,15 @@ def execute(
     plot_binwidth: float,
     **kwargs,
 ) -> tuple[Path, float]:
-    from itaxotools.taxi2.align import Scores
-    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
-    from itaxotools.taxi2.tasks.versus_all import VersusAll
+    if _VersusAll is None:
+        initialize()
+
+    work_dir.mkdir()
 
-    task = VersusAll()
+    task = _VersusAll()
     task.work_dir = work_dir
     task.progress_handler = progress_handler
+    task.progress_interval = 0.05
 
     task.input.sequences = sequences_from_model(input_sequences)
     if perform_species:
@@ -83,46 +131,19 @@ def execute(
         task.input.genera = partition_from_model(input_genera)
 
     task.params.pairs.align = bool(alignment_mode == AlignmentMode.PairwiseAlignment)
-    task.params.pairs.scores = Scores(**alignment_pairwise_scores)
+    task.params.pairs.scores = _Scores(**alignment_pairwise_scores)
     task.params.pairs.write = alignment_write_pairs
 
-    metrics_filter = {
-        AlignmentMode.NoAlignment: [
-            DistanceMetric.Uncorrected,
-            DistanceMetric.UncorrectedWithGaps,
-            DistanceMetric.JukesCantor,
-            DistanceMetric.Kimura2Parameter,
-            DistanceMetric.NCD,
-            DistanceMetric.BBC,
-        ],
-        AlignmentMode.PairwiseAlignment: [
-            DistanceMetric.Uncorrected,
-            DistanceMetric.UncorrectedWithGaps,
-            DistanceMetric.JukesCantor,
-            DistanceMetric.Kimura2Parameter,
-        ],
-        AlignmentMode.AlignmentFree: [
-            DistanceMetric.NCD,
-            DistanceMetric.BBC,
-        ],
-    }[alignment_mode]
-    distance_metrics = (
+    metrics_filter = _metrics_filter[alignment_mode]
+    distance_metrics = tuple(
         metric for metric in distance_metrics if metric in metrics_filter
     )
 
-    metrics_tr = {
-        DistanceMetric.Uncorrected: (BackendDistanceMetric.Uncorrected, []),
-        DistanceMetric.UncorrectedWithGaps: (
-            BackendDistanceMetric.UncorrectedWithGaps,
-            [],
-        ),
-        DistanceMetric.JukesCantor: (BackendDistanceMetric.JukesCantor, []),
-        DistanceMetric.Kimura2Parameter: (BackendDistanceMetric.Kimura2P, []),
-        DistanceMetric.NCD: (BackendDistanceMetric.NCD, []),
-        DistanceMetric.BBC: (BackendDistanceMetric.BBC, [distance_metrics_bbc_k]),
-    }
     metrics = [
-        metrics_tr[metric][0](*metrics_tr[metric][1]) for metric in distance_metrics
+        _metrics_tr[metric](distance_metrics_bbc_k)
+        if metric == DistanceMetric.BBC
+        else _metrics_tr[metric]()
+        for metric in distance_metrics
     ]
     task.params.distances.metrics = metrics
     task.params.distances.write_linear = distance_linear
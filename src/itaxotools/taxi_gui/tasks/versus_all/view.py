@@ -20,13 +20,14 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from itaxotools.common.utility import AttrDict
 from itaxotools.taxi_gui.types import Notification
-from itaxotools.taxi_gui.utility import type_convert
+from itaxotools.taxi_gui.utility import float_or_none, int_or_none, str_or_empty
 from itaxotools.taxi_gui.view.cards import Card
 from itaxotools.taxi_gui.view.tasks import ScrollTaskView
 from itaxotools.taxi_gui.view.widgets import (
     GLineEdit,
     NoWheelComboBox,
     RadioButtonGroup,
+    set_pixel_size,
 )
 
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
@@ -48,7 +49,7 @@ class OptionalCategory(Card):
         super().__init__(parent)
 
         title = QtWidgets.QCheckBox(text)
-        title.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(title, 16)
         title.toggled.connect(self.toggled)
 
         description = QtWidgets.QLabel(description)
@@ -130,7 +131,7 @@ class DistanceMetricSelector(Card):
 
     def draw_main(self):
         label = QtWidgets.QLabel("Distance metrics")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "Select the types of distances that should be calculated for each pair of sequences:"
@@ -285,7 +286,7 @@ class StatisticSelector(Card):
         super().__init__(parent)
 
         title = QtWidgets.QLabel("Calculate simple sequence statistics")
-        title.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(title, 16)
 
         description = QtWidgets.QLabel(
             "Includes information about sequence length, N50/L50 and nucleotide distribution."
@@ -314,7 +315,7 @@ class PlotSelector(Card):
         super().__init__(parent)
 
         title = QtWidgets.QCheckBox("Generate histogram plots")
-        title.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(title, 16)
 
         description = QtWidgets.QLabel(
             "Plot histograms of the distribution of sequence distances across species/genera. "
@@ -463,39 +464,39 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.alignment_mode.resetScores, object.pairwise_scores.reset
         )
+        score_fields = self.cards.alignment_mode.controls.score_fields
+        score_properties = object.pairwise_scores.properties
         for score in PairwiseScore:
+            field = score_fields[score.key]
+            property = score_properties[score.key]
             self.binder.bind(
-                self.cards.alignment_mode.controls.score_fields[
-                    score.key
-                ].textEditedSafe,
-                object.pairwise_scores.properties[score.key],
-                lambda x: type_convert(x, int, None),
+                field.textEditedSafe,
+                property,
+                int_or_none,
             )
             self.binder.bind(
-                object.pairwise_scores.properties[score.key],
-                self.cards.alignment_mode.controls.score_fields[score.key].setText,
-                lambda x: str(x) if x is not None else "",
+                property,
+                field.setText,
+                str_or_empty,
             )
 
-        for key in (metric.key for metric in DistanceMetric):
-            self.binder.bind(
-                self.cards.distance_metrics.controls.metrics[key].toggled,
-                object.distance_metrics.properties[key],
-            )
-            self.binder.bind(
-                object.distance_metrics.properties[key],
-                self.cards.distance_metrics.controls.metrics[key].setChecked,
-            )
+        metric_checks = self.cards.distance_metrics.controls.metrics
+        metric_properties = object.distance_metrics.properties
+        for metric in DistanceMetric:
+            check = metric_checks[metric.key]
+            property = metric_properties[metric.key]
+            self.binder.bind(check.toggled, property)
+            self.binder.bind(property, check.setChecked)
 
         self.binder.bind(
             self.cards.distance_metrics.controls.bbc_k.textEditedSafe,
             object.distance_metrics.properties.bbc_k,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.distance_metrics.properties.bbc_k,
             self.cards.distance_metrics.controls.bbc_k.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             object.distance_metrics.properties.bbc,
@@ -535,12 +536,12 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.distance_metrics.controls.precision.textEditedSafe,
             object.properties.distance_precision,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.properties.distance_precision,
             self.cards.distance_metrics.controls.precision.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             self.cards.distance_metrics.controls.missing.textEditedSafe,
@@ -568,15 +569,13 @@ class View(ScrollTaskView):
             self.cards.distance_metrics.setAlignmentMode,
         )
 
+        group_checks = self.cards.stats_options.controls
+        group_properties = object.statistics_groups.properties
         for group in StatisticsGroup:
-            self.binder.bind(
-                self.cards.stats_options.controls[group.key].toggled,
-                object.statistics_groups.properties[group.key],
-            )
-            self.binder.bind(
-                object.statistics_groups.properties[group.key],
-                self.cards.stats_options.controls[group.key].setChecked,
-            )
+            check = group_checks[group.key]
+            property = group_properties[group.key]
+            self.binder.bind(check.toggled, property)
+            self.binder.bind(property, check.setChecked)
 
         self.binder.bind(
             object.properties.plot_histograms,
@@ -585,7 +584,7 @@ class View(ScrollTaskView):
         self.binder.bind(
             object.properties.plot_binwidth,
             self.cards.plot_options.controls.binwidth.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             self.cards.plot_options.controls.plot.toggled,
@@ -594,7 +593,7 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.plot_options.controls.binwidth.textEditedSafe,
             object.properties.plot_binwidth,
-            lambda x: type_convert(x, float, None),
+            float_or_none,
         )
 
         self.binder.bind(
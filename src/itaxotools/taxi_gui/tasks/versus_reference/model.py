@@ -18,36 +18,42 @@
 
 from datetime import datetime
 from pathlib import Path
-from shutil import copytree
 
 from itaxotools.common.bindings import Binder, EnumObject, Instance, Property
+from itaxotools.common.utility import Guard
 from itaxotools.taxi_gui.model.sequence import SequenceModel
 from itaxotools.taxi_gui.model.tasks import SubtaskModel, TaskModel
 from itaxotools.taxi_gui.types import Notification
 from itaxotools.taxi_gui.utility import human_readable_seconds
 
-from ..common.model import FileInfoSubtaskModel, ImportedInputModel
+from ..common.model import (
+    FileInfoSubtaskModel,
+    ImportedInputModel,
+    SaveSubtaskModel,
+)
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
 from . import process
 
 
 class PairwiseScores(EnumObject):
     enum = PairwiseScore
+    _keys = tuple(score.key for score in PairwiseScore)
 
     def as_dict(self):
-        return {score.key: self.properties[score.key].value for score in self.enum}
+        return {key: self.properties[key].value for key in self._keys}
 
     def is_valid(self):
-        return not any(self.properties[score.key].value is None for score in self.enum)
+        return all(self.properties[key].value is not None for key in self._keys)
 
 
 class DistanceMetrics(EnumObject):
     enum = DistanceMetric
+    _fields = tuple((field, field.key) for field in DistanceMetric)
 
     bbc_k = Property(int | None, 10)
 
     def as_list(self):
-        return [field for field in self.enum if self.properties[field.key].value]
+        return [field for field, key in self._fields if self.properties[key].value]
 
 
 class Model(TaskModel):
@@ -80,29 +86,47 @@ class Model(TaskModel):
         self.subtask_init = SubtaskModel(self, bind_busy=False)
         self.subtask_data = FileInfoSubtaskModel(self)
         self.subtask_reference = FileInfoSubtaskModel(self)
+        self.subtask_save = SaveSubtaskModel(self)
 
         self.binder.bind(self.subtask_data.done, self.onDoneInfoData)
         self.binder.bind(self.subtask_reference.done, self.onDoneInfoReference)
+        self.binder.bind(self.subtask_save.done, self.onDoneSave)
 
         self.binder.bind(self.input_data.notification, self.notification)
         self.binder.bind(self.input_reference.notification, self.notification)
 
-        for handle in [
-            self.properties.busy_subtask,
-            self.properties.alignment_mode,
-            *(property for property in self.pairwise_scores.properties),
-            self.distance_metrics.properties.bbc,
-            self.distance_metrics.properties.bbc_k,
-            self.properties.distance_precision,
-            self.input_data.updated,
-            self.input_reference.updated,
-        ]:
-            self.binder.bind(handle, self.checkReady)
+        self._ready_triggers = None
+        self._ready_guard = Guard()
+        with self._ready_guard:
+            for handle in self.readyTriggers():
+                self.binder.bind(handle, self.checkReady)
+        self.checkReady()
 
         self.subtask_init.start(process.initialize)
 
+    def readyTriggers(self):
+        if self._ready_triggers is None:
+            self._ready_triggers = [
+                self.properties.busy_subtask,
+                self.properties.alignment_mode,
+                *self.pairwise_scores.properties,
+                self.distance_metrics.properties.bbc,
+                self.distance_metrics.properties.bbc_k,
+                self.properties.distance_precision,
+                self.input_data.updated,
+                self.input_reference.updated,
+            ]
+        return self._ready_triggers
+
+    def checkReady(self):
+        if self._ready_guard:
+            return
+        super().checkReady()
+
     def isReady(self):
-        if self.busy_subtask:
+        if self.busy_subtask or self.distance_precision is None:
+            return False
+        if self.distance_metrics.bbc and self.distance_metrics.bbc_k is None:
             return False
         if not self.input_data.is_valid():
             return False
@@ -111,18 +135,12 @@ class Model(TaskModel):
         if self.alignment_mode == AlignmentMode.PairwiseAlignment:
             if not self.pairwise_scores.is_valid():
                 return False
-        if self.distance_metrics.bbc:
-            if self.distance_metrics.bbc_k is None:
-                return False
-        if self.distance_precision is None:
-            return False
         return True
 
     def start(self):
         super().start()
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         work_dir = self.temporary_path / timestamp
-        work_dir.mkdir()
 
         self.exec(
             process.execute,
@@ -160,29 +178,13 @@ class Model(TaskModel):
     def onDoneInfoReference(self, info):
         self.input_reference.add_info(info)
 
-    def onStop(self, report):
-        super().onStop(report)
-        self.busy_main = False
-        self.busy_data = False
-        self.busy_reference = False
-
-    def onFail(self, report):
-        super().onFail(report)
-        self.busy_main = False
-        self.busy_data = False
-        self.busy_reference = False
-
-    def onError(self, report):
-        super().onError(report)
-        self.busy_main = False
-        self.busy_data = False
-        self.busy_reference = False
-
     def clear(self):
         self.dummy_results = None
         self.dummy_time = None
         self.done = False
 
     def save(self, destination: Path):
-        copytree(self.dummy_results, destination, dirs_exist_ok=True)
+        self.subtask_save.start(self.dummy_results, destination)
+
+    def onDoneSave(self, destination: Path):
         self.notification.emit(Notification.Info("Saved files successfully!"))
@@ -32,11 +32,57 @@ class VersusReferenceResults:
     pass
 
 
+_metrics_filter = {
+    AlignmentMode.NoAlignment: frozenset(
+        {
+            DistanceMetric.Uncorrected,
+            DistanceMetric.UncorrectedWithGaps,
+            DistanceMetric.JukesCantor,
+            DistanceMetric.Kimura2Parameter,
+            DistanceMetric.NCD,
+            DistanceMetric.BBC,
+        }
+    ),
+    AlignmentMode.PairwiseAlignment: frozenset(
+        {
+            DistanceMetric.Uncorrected,
+            DistanceMetric.UncorrectedWithGaps,
+            DistanceMetric.JukesCantor,
+            DistanceMetric.Kimura2Parameter,
+        }
+    ),
+    AlignmentMode.AlignmentFree: frozenset(
+        {
+            DistanceMetric.NCD,
+            DistanceMetric.BBC,
+        }
+    ),
+}
+
+_VersusReference = None
+_Scores = None
+_metrics_tr = None
+
+
 def initialize():
+    global _VersusReference, _Scores, _metrics_tr
     import itaxotools
 
     itaxotools.progress_handler("Initializing...")
-    from itaxotools.taxi2.tasks.versus_reference import VersusReference  # noqa
+    from itaxotools.taxi2.align import Scores
+    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
+    from itaxotools.taxi2.tasks.versus_reference import VersusReference
+
+    _VersusReference = VersusReference
+    _Scores = Scores
+    _metrics_tr = {
+        DistanceMetric.Uncorrected: BackendDistanceMetric.Uncorrected,
+        DistanceMetric.UncorrectedWithGaps: BackendDistanceMetric.UncorrectedWithGaps,
+        DistanceMetric.JukesCantor: BackendDistanceMetric.JukesCantor,
+        DistanceMetric.Kimura2Parameter: BackendDistanceMetric.Kimura2P,
+        DistanceMetric.NCD: BackendDistanceMetric.NCD,
+        DistanceMetric.BBC: BackendDistanceMetric.BBC,
+    }
 
 
 def execute(
@@ -55,11 +101,12 @@ def execute(
     distance_precision: int,
     distance_missing: str,
 ) -> tuple[Path, float]:
-    from itaxotools.taxi2.align import Scores
-    from itaxotools.taxi2.distances import DistanceMetric as BackendDistanceMetric
-    from itaxotools.taxi2.tasks.versus_reference import VersusReference
+    if _VersusReference is None:
+        initialize()
+
+    work_dir.mkdir()
 
-    task = VersusReference()
+    task = _VersusReference()
     task.work_dir = work_dir
     task.progress_handler = progress_handler
 
@@ -67,46 +114,19 @@ def execute(
     task.input.reference = sequences_from_model(input_reference)
 
     task.params.pairs.align = bool(alignment_mode == AlignmentMode.PairwiseAlignment)
-    task.params.pairs.scores = Scores(**alignment_pairwise_scores)
+    task.params.pairs.scores = _Scores(**alignment_pairwise_scores)
     task.params.pairs.write = alignment_write_pairs
 
-    metrics_filter = {
-        AlignmentMode.NoAlignment: [
-            DistanceMetric.Uncorrected,
-            DistanceMetric.UncorrectedWithGaps,
-            DistanceMetric.JukesCantor,
-            DistanceMetric.Kimura2Parameter,
-            DistanceMetric.NCD,
-            DistanceMetric.BBC,
-        ],
-        AlignmentMode.PairwiseAlignment: [
-            DistanceMetric.Uncorrected,
-            DistanceMetric.UncorrectedWithGaps,
-            DistanceMetric.JukesCantor,
-            DistanceMetric.Kimura2Parameter,
-        ],
-        AlignmentMode.AlignmentFree: [
-            DistanceMetric.NCD,
-            DistanceMetric.BBC,
-        ],
-    }[alignment_mode]
-    distance_metrics = (
+    metrics_filter = _metrics_filter[alignment_mode]
+    distance_metrics = tuple(
         metric for metric in distance_metrics if metric in metrics_filter
     )
 
-    metrics_tr = {
-        DistanceMetric.Uncorrected: (BackendDistanceMetric.Uncorrected, []),
-        DistanceMetric.UncorrectedWithGaps: (
-            BackendDistanceMetric.UncorrectedWithGaps,
-            [],
-        ),
-        DistanceMetric.JukesCantor: (BackendDistanceMetric.JukesCantor, []),
-        DistanceMetric.Kimura2Parameter: (BackendDistanceMetric.Kimura2P, []),
-        DistanceMetric.NCD: (BackendDistanceMetric.NCD, []),
-        DistanceMetric.BBC: (BackendDistanceMetric.BBC, [distance_metrics_bbc_k]),
-    }
     metrics = [
-        metrics_tr[metric][0](*metrics_tr[metric][1]) for metric in distance_metrics
+        _metrics_tr[metric](distance_metrics_bbc_k)
+        if metric == DistanceMetric.BBC
+        else _metrics_tr[metric]()
+        for metric in distance_metrics
     ]
 
     task.params.distances.metric = metrics[0]  # <-- todo: from main_metric
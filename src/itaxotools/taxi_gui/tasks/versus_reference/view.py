@@ -19,10 +19,14 @@
 from PySide6 import QtWidgets
 
 from itaxotools.common.utility import AttrDict
-from itaxotools.taxi_gui.utility import type_convert
+from itaxotools.taxi_gui.utility import int_or_none, str_or_empty
 from itaxotools.taxi_gui.view.cards import Card
 from itaxotools.taxi_gui.view.tasks import ScrollTaskView
-from itaxotools.taxi_gui.view.widgets import GLineEdit, RadioButtonGroup
+from itaxotools.taxi_gui.view.widgets import (
+    GLineEdit,
+    RadioButtonGroup,
+    set_pixel_size,
+)
 
 from ..common.types import AlignmentMode, DistanceMetric, PairwiseScore
 from ..common.view import (
@@ -43,7 +47,7 @@ class DistanceMetricSelector(Card):
 
     def draw_main(self):
         label = QtWidgets.QLabel("Distance metrics")
-        label.setStyleSheet("""font-size: 16px;""")
+        set_pixel_size(label, 16)
 
         description = QtWidgets.QLabel(
             "Select the types of distances that should be calculated for each pair of sequences:"
@@ -92,9 +96,15 @@ class DistanceMetricSelector(Card):
         metrics_free.addLayout(metric_bbc_k, 1, 2)
         metrics_free.setColumnStretch(2, 2)
 
+        metrics_aligned_widget = QtWidgets.QWidget()
+        metrics_aligned_widget.setLayout(metrics)
+
+        metrics_free_widget = QtWidgets.QWidget()
+        metrics_free_widget.setLayout(metrics_free)
+
         metrics_all = QtWidgets.QVBoxLayout()
-        metrics_all.addLayout(metrics)
-        metrics_all.addLayout(metrics_free)
+        metrics_all.addWidget(metrics_aligned_widget)
+        metrics_all.addWidget(metrics_free_widget)
         metrics_all.setContentsMargins(0, 0, 0, 0)
         metrics_all.setSpacing(8)
 
@@ -114,6 +124,8 @@ class DistanceMetricSelector(Card):
 
         self.controls.bbc_k = metric_bbc_k_field
         self.controls.bbc_k_label = metric_bbc_k_label
+        self.controls.metrics_aligned = metrics_aligned_widget
+        self.controls.metrics_free = metrics_free_widget
 
         self.addLayout(layout)
 
@@ -176,15 +188,9 @@ class DistanceMetricSelector(Card):
 
     def setAlignmentMode(self, mode):
         pairwise = bool(mode == AlignmentMode.PairwiseAlignment)
-        self.controls.metrics.ncd.setVisible(not pairwise)
-        self.controls.metrics.bbc.setVisible(not pairwise)
-        self.controls.bbc_k.setVisible(not pairwise)
-        self.controls.bbc_k_label.setVisible(not pairwise)
         free = bool(mode == AlignmentMode.AlignmentFree)
-        self.controls.metrics.p.setVisible(not free)
-        self.controls.metrics.pg.setVisible(not free)
-        self.controls.metrics.jc.setVisible(not free)
-        self.controls.metrics.k2p.setVisible(not free)
+        self.controls.metrics_free.setVisible(not pairwise)
+        self.controls.metrics_aligned.setVisible(not free)
 
 
 class View(ScrollTaskView):
@@ -259,39 +265,39 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.alignment_mode.resetScores, object.pairwise_scores.reset
         )
+        score_fields = self.cards.alignment_mode.controls.score_fields
+        score_properties = object.pairwise_scores.properties
         for score in PairwiseScore:
+            field = score_fields[score.key]
+            property = score_properties[score.key]
             self.binder.bind(
-                self.cards.alignment_mode.controls.score_fields[
-                    score.key
-                ].textEditedSafe,
-                object.pairwise_scores.properties[score.key],
-                lambda x: type_convert(x, int, None),
+                field.textEditedSafe,
+                property,
+                int_or_none,
             )
             self.binder.bind(
-                object.pairwise_scores.properties[score.key],
-                self.cards.alignment_mode.controls.score_fields[score.key].setText,
-                lambda x: str(x) if x is not None else "",
+                property,
+                field.setText,
+                str_or_empty,
             )
 
-        for key in (metric.key for metric in DistanceMetric):
-            self.binder.bind(
-                self.cards.distance_metrics.controls.metrics[key].toggled,
-                object.distance_metrics.properties[key],
-            )
-            self.binder.bind(
-                object.distance_metrics.properties[key],
-                self.cards.distance_metrics.controls.metrics[key].setChecked,
-            )
+        metric_checks = self.cards.distance_metrics.controls.metrics
+        metric_properties = object.distance_metrics.properties
+        for metric in DistanceMetric:
+            check = metric_checks[metric.key]
+            property = metric_properties[metric.key]
+            self.binder.bind(check.toggled, property)
+            self.binder.bind(property, check.setChecked)
 
         self.binder.bind(
             self.cards.distance_metrics.controls.bbc_k.textEditedSafe,
             object.distance_metrics.properties.bbc_k,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.distance_metrics.properties.bbc_k,
             self.cards.distance_metrics.controls.bbc_k.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             object.distance_metrics.properties.bbc,
@@ -331,12 +337,12 @@ class View(ScrollTaskView):
         self.binder.bind(
             self.cards.distance_metrics.controls.precision.textEditedSafe,
             object.properties.distance_precision,
-            lambda x: type_convert(x, int, None),
+            int_or_none,
         )
         self.binder.bind(
             object.properties.distance_precision,
             self.cards.distance_metrics.controls.precision.setText,
-            lambda x: str(x) if x is not None else "",
+            str_or_empty,
         )
         self.binder.bind(
             self.cards.distance_metrics.controls.missing.textEditedSafe,
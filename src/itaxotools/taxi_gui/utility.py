@@ -16,6 +16,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
+from functools import lru_cache
+
 
 def type_convert(value, type, default):
     try:
@@ -24,6 +26,19 @@ def type_convert(value, type, default):
         return default
 
 
+def int_or_none(value):
+    return type_convert(value, int, None)
+
+
+def float_or_none(value):
+    return type_convert(value, float, None)
+
+
+def str_or_empty(value):
+    return str(value) if value is not None else ""
+
+
+@lru_cache(maxsize=1024)
 def human_readable_size(size):
     for unit in ["B", "KB", "MB", "GB"]:
         if size < 1000.0 or unit == "GB":
@@ -35,6 +50,9 @@ def human_readable_size(size):
 
 
 def human_readable_seconds(seconds):
+    if seconds < 60:
+        return f"{seconds:.2f} seconds" if seconds else ""
+
     m, s = divmod(seconds, 60)
     h, m = divmod(m, 60)
 
@@ -18,6 +18,8 @@
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from itertools import pairwise
+
 from itaxotools.common.utility import AttrDict, override
 
 from .animations import VerticalRollAnimation
@@ -26,22 +28,43 @@ from .animations import VerticalRollAnimation
 class CardLayout(QtWidgets.QBoxLayout):
     def __init__(self, parent=None):
         super().__init__(QtWidgets.QBoxLayout.TopToBottom, parent)
+        self._items = None
+        self._separators = None
+        self._heights = {}
+        self._widths = {}
 
     def __iter__(self):
-        for index in range(self.count()):
-            yield self.itemAt(index)
+        return (item for item, _ in self._entries())
+
+    def _entries(self):
+        if self._items is None:
+            items = (self.itemAt(index) for index in range(self.count()))
+            self._items = tuple((item, self._visibilityGetter(item)) for item in items)
+        return self._items
 
-    def _isItemVisible(self, item):
-        if isinstance(item, QtWidgets.QWidget):
-            return item.isVisible()
-        elif isinstance(item, QtWidgets.QWidgetItem):
-            return item.widget().isVisible()
-        return True
+    @override
+    def invalidate(self):
+        self._items = None
+        self._separators = None
+        self._heights.clear()
+        self._widths.clear()
+        super().invalidate()
+
+    @staticmethod
+    def _visibilityGetter(item):
+        widget = item.widget()
+        if widget is None:
+            return lambda: True
+        return widget.isVisible
+
+    def _visibility(self):
+        return tuple(visible() for _, visible in self._entries())
+
+    def _iterVisibleItems(self):
+        return (item for item, visible in self._entries() if visible())
 
     def _iterVisibleItemHeights(self, width=-1):
-        for item in self:
-            if not self._isItemVisible(item):
-                continue
+        for item in self._iterVisibleItems():
             if item.hasHeightForWidth():
                 yield item.heightForWidth(width)
             else:
@@ -63,28 +86,37 @@ class CardLayout(QtWidgets.QBoxLayout):
         return False
 
     def heightForWidth(self, width):
+        key = (width, self._visibility())
+        if key in self._heights:
+            return self._heights[key]
+
         margins = self.contentsMargins()
         width -= margins.left() + margins.right()
         height = margins.top() + margins.bottom()
 
+        visible = 0
         for item_height in self._iterVisibleItemHeights(width):
             height += item_height
+            visible += 1
 
-        visible = sum(1 for item in self if self._isItemVisible(item))
         if visible > 1:
             height += (visible - 1) * self.spacing()
 
+        self._heights[key] = height
         return height
 
     def minimumWidth(self):
+        key = self._visibility()
+        if key in self._widths:
+            return self._widths[key]
+
         margins = self.contentsMargins()
         width = margins.left() + margins.right()
 
-        for item in self:
-            if not self._isItemVisible(item):
-                continue
+        for item in self._iterVisibleItems():
             width = max(width, item.sizeHint().width())
 
+        self._widths[key] = width
         return width
 
     def sizeHint(self):
@@ -102,10 +134,11 @@ class CardLayout(QtWidgets.QBoxLayout):
         yy_incr = height / self.count() if self.count() else 0
         xx = rect.x()
         yy = rect.y()
-        for item in self:
+        separators = []
+        for index, item in enumerate(self._iterVisibleItems()):
+            if index:
+                separators.append(yy - self.spacing() / 2)
             item_rect = QtCore.QRect(xx, yy, width, yy_incr)
-            if not self._isItemVisible(item):
-                continue
             if item.hasHeightForWidth():
                 height = item.heightForWidth(width)
             else:
@@ -114,16 +147,23 @@ class CardLayout(QtWidgets.QBoxLayout):
             item.setGeometry(item_rect)
             yy += height
             yy += self.spacing()
+        self._separators = separators
 
     def separatorPositions(self, width=-1):
         positions = []
         cursor = self.contentsMargins().top()
-        for height in self._iterVisibleItemHeights(width):
+        heights = self._iterVisibleItemHeights(width)
+        for height, _ in pairwise(heights):
             cursor += height
             position = cursor + self.spacing() / 2
             positions.append(position)
             cursor += self.spacing()
-        return positions[:-1]
+        return positions
+
+    def separators(self, width=-1):
+        if self._separators is None:
+            return self.separatorPositions(width)
+        return self._separators
 
 
 class Card(QtWidgets.QFrame):
@@ -133,6 +173,7 @@ class Card(QtWidgets.QFrame):
         self.roll_animation = VerticalRollAnimation(self)
         self.controls = AttrDict()
         self.separator_margin = 8
+        self._separator_pen = None
 
         layout = CardLayout()
         layout.setContentsMargins(16, 10, 16, 10)
@@ -155,21 +196,36 @@ class Card(QtWidgets.QFrame):
         super().setVisible(value)
         self.update()
 
+    @override
+    def changeEvent(self, event):
+        if event.type() in (QtCore.QEvent.PaletteChange, QtCore.QEvent.StyleChange):
+            self._separator_pen = None
+        super().changeEvent(event)
+
     @override
     def paintEvent(self, event):
         super().paintEvent(event)
 
-        if self.layout().count():
-            self.paintSeparators()
+        layout = self.layout()
+        if not layout.count():
+            return
+        if self.height() <= layout.contentsMargins().top():
+            return
+        self.paintSeparators(event.region())
 
-    def paintSeparators(self):
-        option = QtWidgets.QStyleOption()
-        option.initFrom(self)
+    def paintSeparators(self, region: QtGui.QRegion):
+        if self._separator_pen is None:
+            self._separator_pen = QtGui.QPen(self.palette().color(QtGui.QPalette.Mid))
         painter = QtGui.QPainter(self)
-        painter.setPen(option.palette.color(QtGui.QPalette.Mid))
+        painter.setPen(self._separator_pen)
 
         left = self.separator_margin
         right = self.width() - self.separator_margin
 
-        for position in self.layout().separatorPositions(self.width()):
-            painter.drawLine(left, position, right, position)
+        lines = [
+            QtCore.QLineF(left, position, right, position)
+            for position in self.layout().separators(self.width())
+            if region.intersects(QtCore.QRect(left, int(position) - 1, right - left, 2))
+        ]
+        if lines:
+            painter.drawLines(lines)
@@ -18,11 +18,18 @@
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from functools import partial
 from time import time_ns
 
 from itaxotools.common.utility import Guard, override
 
 
+def set_pixel_size(widget: QtWidgets.QWidget, size: int):
+    font = widget.font()
+    font.setPixelSize(size)
+    widget.setFont(font)
+
+
 class DarkWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -128,13 +135,13 @@ class RadioButtonGroup(QtCore.QObject):
 
     def add(self, widget, value):
         self.members[widget] = value
-        widget.toggled.connect(self.handleToggle)
+        widget.toggled.connect(partial(self.handleToggle, value))
         self.buttons.addButton(widget)
 
-    def handleToggle(self, checked):
+    def handleToggle(self, value, checked):
         if not checked:
             return
-        self.value = self.members[self.sender()]
+        self.value = value
         self.valueChanged.emit(self.value)
 
     def setValue(self, newValue):
@@ -1,48 +1,97 @@
 import hashlib
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.request import urlopen
 
 from delocate.fuse import fuse_wheels
-from yaml import safe_load
+from yaml import load
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-def calculate_sha256(file_path):
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as file:
-        for byte_block in iter(lambda: file.read(4096), b""):
-            sha256.update(byte_block)
-    return sha256.hexdigest()
+CHUNK_SIZE = 1024 * 1024
+CACHE_DIR = Path(
+    os.environ.get("TAXI_WHEELS_CACHE", Path.home() / ".cache" / "taxi-wheels")
+).absolute()
 
+# fuse_wheels changes the process working directory, so fusing is serialized
+# and every other path used by the download threads must be absolute
+FUSE_LOCK = threading.Lock()
 
-def verify_file(file_path, expected_hash):
-    calculated_hash = calculate_sha256(file_path)
-    return calculated_hash == expected_hash
 
-
-def download_file(egg, url, tmp_dir: Path) -> Path:
+def download_file(egg, url, tmp_dir: Path) -> tuple[Path, str]:
     with urlopen(url) as response:
         if response.getcode() != 200:
             raise Exception(
                 f"Failed to download wheel for egg: {egg}. HTTP status code: {response.getcode()}"
             )
+        length = response.headers.get("Content-Length")
         file_name = Path(url).name
         file_path = tmp_dir / file_name
+        sha256 = hashlib.sha256()
+        size = 0
         with open(file_path, "wb") as file:
-            file.write(response.read())
-        return file_path
+            while chunk := response.read(CHUNK_SIZE):
+                sha256.update(chunk)
+                file.write(chunk)
+                size += len(chunk)
+        if length is not None and size != int(length):
+            raise Exception(
+                f"Incomplete download for egg: {egg}. Received {size} of {length} bytes"
+            )
+        return file_path, sha256.hexdigest()
+
+
+def copy_file(source_path: Path, file_path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(source_path, "rb") as source, open(file_path, "wb") as file:
+        while chunk := source.read(CHUNK_SIZE):
+            sha256.update(chunk)
+            file.write(chunk)
+    return sha256.hexdigest()
+
+
+def fetch_file(egg, url, expected_hash: str, tmp_dir: Path) -> tuple[Path, str]:
+    file_name = Path(url).name
+    file_path = tmp_dir / file_name
+    cache_path = CACHE_DIR / expected_hash / file_name
+    if cache_path.exists():
+        file_hash = copy_file(cache_path, file_path)
+        if file_hash == expected_hash:
+            print(f"Using cached {file_name}")
+            return file_path, file_hash
+        print(f"Discarding corrupted cache entry for {file_name}")
+        cache_path.unlink(missing_ok=True)
+        file_path.unlink()
+
+    file_path, file_hash = download_file(egg, url, tmp_dir)
+    if file_hash != expected_hash:
+        file_path.unlink()
+        return file_path, file_hash
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_name(file_name + ".part")
+    shutil.copyfile(file_path, partial_path)
+    os.replace(partial_path, cache_path)
+    return file_path, file_hash
 
 
 def download_universal2_wheel(wheel: dict, tmp_dir: Path):
     egg = wheel["egg"]
     url = wheel["universal2_url"]
-    hash = wheel["universal2_sha256"]
+    universal2_hash = wheel["universal2_sha256"]
 
     print(f"Downloading wheel for {egg}...")
-    file_path = download_file(egg, url, tmp_dir)
-    if not verify_file(file_path, hash):
+    _, file_hash = fetch_file(egg, url, universal2_hash, tmp_dir)
+    if file_hash != universal2_hash:
         raise Exception(f"Wheel hash does not match for: {egg}")
 
 
@@ -54,19 +103,20 @@ def download_and_fuse_wheels(wheel: dict, tmp_dir: Path):
     x86_64_hash = wheel["x86_64_sha256"]
 
     print(f"Downloading arm64 wheel for {egg}...")
-    arm64_path = download_file(egg, arm64_url, tmp_dir)
-    if not verify_file(arm64_path, arm64_hash):
+    arm64_path, file_hash = fetch_file(egg, arm64_url, arm64_hash, tmp_dir)
+    if file_hash != arm64_hash:
         raise Exception(f"Wheel hash (arm64) does not match for: {egg}")
 
     print(f"Downloading x86_64 wheel for {egg}...")
-    x86_64_path = download_file(egg, x86_64_url, tmp_dir)
-    if not verify_file(x86_64_path, x86_64_hash):
+    x86_64_path, file_hash = fetch_file(egg, x86_64_url, x86_64_hash, tmp_dir)
+    if file_hash != x86_64_hash:
         raise Exception(f"Wheel hash (x86_64) does not match for: {egg}")
 
     print(f"Fusing universal2 wheel for {egg}...")
     stem = arm64_path.name.split("-macosx")[0]
     universal2_path = tmp_dir / f"{stem}-macosx_11_0_universal2.whl"
-    fuse_wheels(arm64_path, x86_64_path, universal2_path)
+    with FUSE_LOCK:
+        fuse_wheels(arm64_path, x86_64_path, universal2_path)
 
     arm64_path.unlink()
     x86_64_path.unlink()
@@ -75,11 +125,11 @@ def download_and_fuse_wheels(wheel: dict, tmp_dir: Path):
 def download_source_tarball(wheel: dict, tmp_dir: Path):
     egg = wheel["egg"]
     url = wheel["source_url"]
-    hash = wheel["source_sha256"]
+    source_hash = wheel["source_sha256"]
 
     print(f"Downloading source for {egg}...")
-    file_path = download_file(egg, url, tmp_dir)
-    if not verify_file(file_path, hash):
+    _, file_hash = fetch_file(egg, url, source_hash, tmp_dir)
+    if file_hash != source_hash:
         raise Exception(f"Source hash does not match for: {egg}")
 
 
@@ -94,28 +144,57 @@ def download_wheel(wheel: dict, tmp_dir: Path):
     raise Exception(f"Bad wheel definition for: {egg}")
 
 
-def download_wheels(wheels: list[dict], tmp_dir: Path):
-    for wheel in wheels:
-        download_wheel(wheel, tmp_dir)
+def download_wheels(wheels: list[dict], tmp_dir: Path, max_workers: int = 8):
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(download_wheel, wheel, tmp_dir) for wheel in wheels]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 
 def install_all(tmp_dir: Path):
-    wheels = list(tmp_dir.glob("*.whl")) + list(tmp_dir.glob("*.tar.gz"))
-    cmd = [sys.executable, "-m", "pip", "install", "--force-reinstall"]
-    cmd.extend(wheel.name for wheel in wheels)
+    wheels = [
+        entry.name
+        for entry in os.scandir(tmp_dir)
+        if entry.name.endswith((".whl", ".tar.gz"))
+    ]
+    cmd = [sys.executable, "-m", "pip", "install", "--force-reinstall", "--no-deps"]
+    cmd.append("--disable-pip-version-check")
+    cmd.extend(wheels)
     print("Running:", " ".join(cmd))
     subprocess.check_call(cmd, cwd=tmp_dir)
 
 
+def prune_cache(wheels: list[dict]):
+    if not CACHE_DIR.is_dir():
+        return
+    pinned = {
+        value
+        for wheel in wheels
+        for key, value in wheel.items()
+        if key.endswith("_sha256")
+    }
+    for entry in CACHE_DIR.iterdir():
+        if entry.is_dir() and entry.name not in pinned:
+            print(f"Removing stale cache entry {entry.name}")
+            shutil.rmtree(entry)
+
+
 def main(path: str):
     with open(path) as file:
         text = file.read()
 
-    wheels = safe_load(text)
+    wheels = load(text, Loader=SafeLoader)
+    prune_cache(wheels)
 
     with tempfile.TemporaryDirectory() as tmp_dir:
-        download_wheels(wheels, Path(tmp_dir))
-        install_all(Path(tmp_dir))
+        tmp_dir = Path(tmp_dir).absolute()
+        download_wheels(wheels, tmp_dir)
+        install_all(tmp_dir)
 
 
 if __name__ == "__main__":